@@ -50,6 +50,14 @@ contract Strategy is BaseStrategy, IERC721Receiver {
     address public constant eth = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE;
     IWETH9 public constant weth = IWETH9(0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2);
 
+    // protocol addresses derived from the 88mph pool. Clones of the same pool family can copy these from an existing
+    // strategy to skip the chained lookups during initialization
+    struct ProtocolAddresses {
+        address vestor;
+        address reward;
+        address nft;
+    }
+
     constructor(
         address _vault,
         address _pool,
@@ -57,7 +65,7 @@ contract Strategy is BaseStrategy, IERC721Receiver {
         address _bancorRegistry
     )
     public BaseStrategy(_vault){
-        _initializeStrat(_vault, _pool, _stakeToken, _bancorRegistry);
+        _initializeStrat(_vault, _pool, _stakeToken, _bancorRegistry, address(0));
     }
 
     function initialize(
@@ -70,20 +78,47 @@ contract Strategy is BaseStrategy, IERC721Receiver {
         address _bancorRegistry
     ) external {
         _initialize(_vault, _strategist, _rewards, _keeper);
-        _initializeStrat(_vault, _pool, _stakeToken, _bancorRegistry);
+        _initializeStrat(_vault, _pool, _stakeToken, _bancorRegistry, address(0));
+    }
+
+    // same as initialize, but copies vestor, reward and nft from _source, an existing strategy on _pool
+    function initializeFrom(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _pool,
+        address _stakeToken,
+        address _bancorRegistry,
+        address _source
+    ) external {
+        _initialize(_vault, _strategist, _rewards, _keeper);
+        _initializeStrat(_vault, _pool, _stakeToken, _bancorRegistry, _source);
     }
 
     function _initializeStrat(
         address _vault,
         address _pool,
         address _stakeToken,
-        address _bancorRegistry
+        address _bancorRegistry,
+        address _source
     ) internal {
         pool = IDInterest(_pool);
         require(address(want) == pool.stablecoin(), "Wrong pool!");
-        vestor = IVesting(IMphMinter(pool.mphMinter()).vesting02());
-        reward = IERC20(vestor.token());
-        nft = INft(pool.depositNFT());
+        // without a source strategy, look everything up from the pool
+        if (_source == address(0)) {
+            vestor = IVesting(IMphMinter(pool.mphMinter()).vesting02());
+            reward = IERC20(vestor.token());
+            nft = INft(pool.depositNFT());
+        } else {
+            // the source has to sit on the same pool, so its addresses belong to the same family
+            Strategy source = Strategy(payable(_source));
+            require(address(source.pool()) == _pool, "Wrong source!");
+            ProtocolAddresses memory protocol = source.protocolAddresses();
+            vestor = IVesting(protocol.vestor);
+            reward = IERC20(protocol.reward);
+            nft = INft(protocol.nft);
+        }
         stake = IStake(_stakeToken);
         //        healthCheck = address(0xDDCea799fF1699e98EDF118e0629A974Df7DF012);
         bancorRegistry = IBancorRegistry(_bancorRegistry);
@@ -108,6 +143,41 @@ contract Strategy is BaseStrategy, IERC721Receiver {
         address _stakeToken,
         address _bancorRegistry
     ) external returns (address payable newStrategy) {
+        newStrategy = _deployClone(0, false);
+        Strategy(newStrategy).initialize(_vault, _strategist, _rewards, _keeper, _pool, _stakeToken, _bancorRegistry);
+        emit Cloned(newStrategy);
+    }
+
+    // CREATE2 clone. The address is known ahead of time via predictCloneAddress(msg.sender, _salt).
+    // _source is an existing strategy on _pool to copy protocol addresses from, or address(0) to look them up
+    function cloneDeterministic(
+        bytes32 _salt,
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _pool,
+        address _stakeToken,
+        address _bancorRegistry,
+        address _source
+    ) external returns (address payable newStrategy) {
+        newStrategy = _deployClone(keccak256(abi.encodePacked(msg.sender, _salt)), true);
+        Strategy(newStrategy).initializeFrom(_vault, _strategist, _rewards, _keeper, _pool, _stakeToken, _bancorRegistry, _source);
+        emit Cloned(newStrategy);
+    }
+
+    // salt is bound to the deployer so nobody else can squat on a precomputed address
+    function predictCloneAddress(address _deployer, bytes32 _salt) external view returns (address) {
+        bytes32 initCodeHash = keccak256(abi.encodePacked(
+                hex"3d602d80600a3d3981f3363d3d373d3d3d363d73",
+                address(this),
+                hex"5af43d82803e903d91602b57fd5bf3"
+            ));
+        bytes32 salt = keccak256(abi.encodePacked(_deployer, _salt));
+        return address(uint(keccak256(abi.encodePacked(bytes1(0xff), address(this), salt, initCodeHash))));
+    }
+
+    function _deployClone(bytes32 _salt, bool _deterministic) internal returns (address payable newStrategy) {
         require(isOriginal);
 
         bytes20 addressBytes = bytes20(address(this));
@@ -118,20 +188,29 @@ contract Strategy is BaseStrategy, IERC721Receiver {
             mstore(clone_code, 0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000)
             mstore(add(clone_code, 0x14), addressBytes)
             mstore(add(clone_code, 0x28), 0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000)
-            newStrategy := create(0, clone_code, 0x37)
+            switch _deterministic
+            case 0 {
+                newStrategy := create(0, clone_code, 0x37)
+            }
+            default {
+                newStrategy := create2(0, clone_code, 0x37, _salt)
+            }
         }
 
-        Strategy(newStrategy).initialize(_vault, _strategist, _rewards, _keeper, _pool, _stakeToken, _bancorRegistry);
-        emit Cloned(newStrategy);
+        // create2 returns 0 if the address is already taken
+        require(newStrategy != address(0), "Clone failed");
     }
 
-
     function name() external view override returns (string memory) {
         return "88-MPH Staker";
     }
 
     // fixed rate interest only comes after deposit has matured
     function estimatedTotalAssets() public view override returns (uint256) {
+        // 88mph reverts on deposit id 0, which is all there is before the first deposit
+        if (depositId == 0) {
+            return balanceOfWant();
+        }
         uint depositWithInterest = getDepositInfo().virtualTokenTotalSupply;
         uint interestRate = getDepositInfo().interestRate;
         uint wants = balanceOfWant();
@@ -144,15 +223,17 @@ contract Strategy is BaseStrategy, IERC721Receiver {
         }
 
         uint256 beforeWant = balanceOfWant();
+        // want already loose beyond what the vault has lent, e.g. sent straight to the strategy, is profit as it is
+        uint256 looseProfit = _looseProfit(beforeWant.sub(_debtPayment));
 
-        _collect();
+        _collect(looseProfit);
         _claim();
         _consolidate();
         _sell();
 
         uint256 afterWant = balanceOfWant();
 
-        _profit = afterWant.sub(beforeWant);
+        _profit = afterWant.sub(beforeWant).add(looseProfit);
         if (_profit > _loss) {
             _profit = _profit.sub(_loss);
             _loss = 0;
@@ -176,12 +257,11 @@ contract Strategy is BaseStrategy, IERC721Receiver {
 
         uint256 loose = balanceOfWant();
         if (_amountNeeded > loose) {
-            uint toExitAmount = _amountNeeded.sub(loose);
-            IDInterest.Deposit memory depositInfo = getDepositInfo();
-            uint toExitVirtualAmount = toExitAmount.mul(depositInfo.interestRate.add(1e18)).div(1e18);
-            uint amt = hasMatured() ? toExitAmount : toExitVirtualAmount;
-            if (amt > dust && amt.sub(dust) > minWithdraw) {
-                pool.withdraw(depositId, amt.sub(dust), !hasMatured());
+            if (depositId != 0) {
+                uint toExitAmount = _amountNeeded.sub(loose);
+                IDInterest.Deposit memory depositInfo = getDepositInfo();
+                uint toExitVirtualAmount = toExitAmount.mul(depositInfo.interestRate.add(1e18)).div(1e18);
+                _withdraw(hasMatured() ? toExitAmount : toExitVirtualAmount, depositInfo);
             }
 
             _liquidatedAmount = Math.min(balanceOfWant(), _amountNeeded);
@@ -193,10 +273,9 @@ contract Strategy is BaseStrategy, IERC721Receiver {
     }
 
     function liquidateAllPositions() internal override returns (uint256) {
-        IDInterest.Deposit memory depositInfo = getDepositInfo();
-        uint toExit = depositInfo.virtualTokenTotalSupply;
-        if (toExit > dust && toExit.sub(dust) > minWithdraw) {
-            pool.withdraw(depositId, toExit.sub(dust), !(now > depositInfo.maturationTimestamp));
+        if (depositId != 0) {
+            IDInterest.Deposit memory depositInfo = getDepositInfo();
+            _withdraw(depositInfo.virtualTokenTotalSupply, depositInfo);
         }
         return balanceOfWant();
     }
@@ -268,21 +347,39 @@ contract Strategy is BaseStrategy, IERC721Receiver {
     }
 
     // collect the fixed-rate interest once it has rolled over
-    function _collect() internal {
+    // _looseProfit is already out of the deposit, so only the deposit's own surplus over debt is withdrawn
+    function _collect(uint _looseProfit) internal {
         if (depositId != 0 && !hasMatured()) {
             uint eta = estimatedTotalAssets();
-            uint debt = vault.strategies(address(this)).totalDebt;
-            if (eta > debt) {
-                uint toExitAmount = eta.sub(debt);
+            uint covered = vault.strategies(address(this)).totalDebt.add(_looseProfit);
+            if (eta > covered) {
+                uint toExitAmount = eta.sub(covered);
                 IDInterest.Deposit memory depositInfo = getDepositInfo();
-                uint toExitVirtualAmount = toExitAmount.mul(depositInfo.interestRate.add(1e18)).div(1e18);
-                if (toExitVirtualAmount > dust && toExitVirtualAmount.sub(dust) > minWithdraw) {
-                    pool.withdraw(depositId, toExitVirtualAmount.sub(dust), !hasMatured());
-                }
+                _withdraw(toExitAmount.mul(depositInfo.interestRate.add(1e18)).div(1e18), depositInfo);
             }
         }
     }
 
+    // the part of _loose that is surplus over debt. Want freed to pay debt back is passed in excluded
+    function _looseProfit(uint256 _loose) internal view returns (uint256) {
+        uint eta = estimatedTotalAssets();
+        uint debt = vault.strategies(address(this)).totalDebt;
+        return eta > debt ? Math.min(eta.sub(debt), _loose) : 0;
+    }
+
+    // withdraw _virtualAmount less dust, skipping withdrawals the pool would revert on (see setDust/setMinWithdraw).
+    // Callers make sure there is a deposit, since reading it already reverts otherwise
+    function _withdraw(uint _virtualAmount, IDInterest.Deposit memory _depositInfo) internal {
+        uint total = _depositInfo.virtualTokenTotalSupply;
+        if (_virtualAmount <= dust || total <= dust) {
+            return;
+        }
+        uint amt = Math.min(_virtualAmount.sub(dust), total.sub(dust));
+        if (amt > minWithdraw) {
+            pool.withdraw(depositId, amt, !(now > _depositInfo.maturationTimestamp));
+        }
+    }
+
     // sell mph for want
     function _sell() internal {
         uint toSell = balanceOfReward();
@@ -330,6 +427,11 @@ contract Strategy is BaseStrategy, IERC721Receiver {
         return vestor.getVest(vestId());
     }
 
+    // already resolved addresses of this strategy's pool family, copied by clones that name it as their source
+    function protocolAddresses() public view returns (ProtocolAddresses memory _protocol){
+        return ProtocolAddresses(address(vestor), address(reward), address(nft));
+    }
+
     function hasMatured() public view returns (bool){
         return now > getDepositInfo().maturationTimestamp;
     }
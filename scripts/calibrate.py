@@ -0,0 +1,116 @@
+import json
+from pathlib import Path
+
+from brownie import Contract, Strategy, accounts, chain, config, interface, project, web3
+from brownie.exceptions import VirtualMachineError
+
+from scripts.constants import BANCOR_REGISTRY, STAKE_TOKEN, amounts, pools, token_address, whale_address
+
+# Finds the smallest dust and minWithdraw each 88mph pool accepts and records them in calibration.json, which
+# scripts/deploy.py and the tests pick up.
+#
+#   brownie run calibrate main [SYMBOL ...] --network mainnet-fork
+#
+# Every probe is a real pool.withdraw from the strategy, rolled back with a snapshot/revert. Both early withdrawals and
+# withdrawals past maturation are probed, and the stricter of the two is recorded.
+
+CALIBRATION_FILE = Path(__file__).parent.parent / "calibration.json"
+
+
+def load():
+    if not CALIBRATION_FILE.exists():
+        return {}
+    return {web3.toChecksumAddress(k): v for k, v in json.loads(CALIBRATION_FILE.read_text()).items()}
+
+
+def lookup(pool):
+    # (dust, minWithdraw) recorded for pool, or None if it was never calibrated
+    entry = load().get(web3.toChecksumAddress(pool))
+    return None if entry is None else (entry["dust"], entry["minWithdraw"])
+
+
+def _withdraws(strategy, amount, early):
+    # whether withdrawing amount of the strategy's deposit goes through and actually pays out want
+    if not early:
+        chain.sleep(strategy.getDepositInfo()[4] - chain.time() + 1)
+        chain.mine(1)
+    before = strategy.balanceOfWant()
+    try:
+        interface.IDInterest(strategy.pool()).withdraw(
+            strategy.depositId(), amount, early, {"from": accounts.at(strategy.address, force=True)}
+        )
+        return strategy.balanceOfWant() > before
+    except VirtualMachineError:
+        return False
+    finally:
+        chain.revert()
+
+
+def _smallest(lo, hi, ok):
+    # smallest x in [lo, hi] for which ok(x) holds, assuming ok is monotone. hi + 1 if there is none
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        if ok(mid):
+            hi = mid - 1
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _calibrate(strategy, total, early):
+    mode = "early" if early else "matured"
+    # full withdrawal has to go through with only dust left behind
+    dust = _smallest(0, total - 1, lambda d: _withdraws(strategy, total - d, early))
+    if dust == total:
+        raise ValueError(f"No {mode} withdrawal from pool {strategy.pool()} goes through")
+    # strategy withdraws only when amount > minWithdraw, so one below the smallest amount that goes through
+    min_withdraw = _smallest(1, total - dust, lambda a: _withdraws(strategy, a, early)) - 1
+    if min_withdraw == total - dust:
+        raise ValueError(f"No partial {mode} withdrawal from pool {strategy.pool()} goes through")
+    return dust, min_withdraw
+
+
+def calibrate(strategy):
+    total = strategy.getDepositInfo()[0]
+    chain.snapshot()
+    early = _calibrate(strategy, total, True)
+    matured = _calibrate(strategy, total, False)
+    return max(early[0], matured[0]), max(early[1], matured[1])
+
+
+def _setup(Vault, symbol, gov):
+    token = Contract(token_address[symbol])
+    amount = amounts[symbol] * 10 ** token.decimals()
+    token.transfer(gov, amount, {"from": accounts.at(whale_address[symbol], force=True)})
+
+    vault = gov.deploy(Vault)
+    vault.initialize(token, gov, gov, "", "", gov, gov, {"from": gov})
+    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+    strategy = gov.deploy(Strategy, vault, pools[symbol], STAKE_TOKEN, BANCOR_REGISTRY)
+    vault.addStrategy(strategy, 10_000, 0, 2 ** 256 - 1, 1_000, {"from": gov})
+
+    token.approve(vault, amount, {"from": gov})
+    vault.deposit(amount, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    # gas for the probes sent from the strategy itself
+    gov.transfer(strategy, "1 ether")
+    return strategy
+
+
+def main(*symbols):
+    Vault = project.load(Path.home() / ".brownie" / "packages" / config["dependencies"][0]).Vault
+    gov = accounts[0]
+    calibration = load()
+    for symbol in symbols or pools:
+        strategy = _setup(Vault, symbol, gov)
+        dust, min_withdraw = calibrate(strategy)
+        calibration[web3.toChecksumAddress(pools[symbol])] = {
+            "token": symbol,
+            "dust": dust,
+            "minWithdraw": min_withdraw,
+        }
+        print(f"{symbol}: dust={dust} minWithdraw={min_withdraw}")
+
+    CALIBRATION_FILE.write_text(json.dumps(calibration, indent=2, sort_keys=True) + "\n")
+    print(f"Saved to {CALIBRATION_FILE}")
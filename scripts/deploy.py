@@ -4,6 +4,9 @@ from brownie import Strategy, accounts, config, network, project, web3
 from eth_utils import is_checksum_address
 import click
 
+from scripts.calibrate import lookup
+from scripts.constants import BANCOR_REGISTRY, STAKE_TOKEN
+
 API_VERSION = config["dependencies"][0].split("@")[-1]
 Vault = project.load(
     Path.home() / ".brownie" / "packages" / config["dependencies"][0]
@@ -51,8 +54,23 @@ def main():
     symbol: '{vault.symbol()}'
     """
     )
+    pool = get_address("88mph Pool: ")
+    calibrated = lookup(pool)
+    if calibrated is None:
+        print("No calibration for this pool, run `brownie run calibrate` first or set dust/minWithdraw by hand")
+    else:
+        print(f"Calibrated dust: {calibrated[0]}, minWithdraw: {calibrated[1]}")
+
     publish_source = click.confirm("Verify source on etherscan?")
     if input("Deploy Strategy? y/[N]: ").lower() != "y":
         return
 
-    strategy = Strategy.deploy(vault, {"from": dev}, publish_source=publish_source)
+    strategy = Strategy.deploy(vault, pool, STAKE_TOKEN, BANCOR_REGISTRY, {"from": dev}, publish_source=publish_source)
+
+    if calibrated is not None:
+        # setDust and setMinWithdraw are limited to vault managers
+        if dev.address in (vault.governance(), vault.management()):
+            strategy.setDust(calibrated[0], {"from": dev})
+            strategy.setMinWithdraw(calibrated[1], {"from": dev})
+        else:
+            print(f"Have governance call setDust({calibrated[0]}) and setMinWithdraw({calibrated[1]})")
@@ -0,0 +1,218 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+from brownie import Strategy, interface, web3
+
+# Replays past harvests of a strategy and attributes each harvest's profit to its sources.
+#
+#   brownie run replay main <strategy> <from_block> [to_block] --network mainnet
+#
+# Needs an archive node (or a local chain) since every read is pinned to a historical block.
+
+CACHE_DIR = Path(".replay_cache")
+MAX_WORKERS = 8
+LOG_CHUNK = 10_000
+
+VAULT_ABI = [
+    {
+        "name": "strategies",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "arg0", "type": "address"}],
+        "outputs": [
+            {"name": "performanceFee", "type": "uint256"},
+            {"name": "activation", "type": "uint256"},
+            {"name": "debtRatio", "type": "uint256"},
+            {"name": "minDebtPerHarvest", "type": "uint256"},
+            {"name": "maxDebtPerHarvest", "type": "uint256"},
+            {"name": "lastReport", "type": "uint256"},
+            {"name": "totalDebt", "type": "uint256"},
+            {"name": "totalGain", "type": "uint256"},
+            {"name": "totalLoss", "type": "uint256"},
+        ],
+    }
+]
+STAKE_ABI = [
+    {
+        "name": "getPricePerFullShare",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "uint256"}],
+    }
+]
+
+# field positions of the structs returned by getDepositInfo / getVest
+DEPOSIT_MATURATION = 4
+VEST_WITHDRAWN = 4
+
+NO_DEPOSIT = [0, 0, 0, 0, 0, 0]
+NO_VEST = ["0x0000000000000000000000000000000000000000", 0, 0, 0, 0, 0]
+
+
+def harvests(strategy, from_block, to_block, chunk=LOG_CHUNK):
+    event = web3.eth.contract(strategy.address, abi=strategy.abi).events.Harvested
+    found = []
+    for start in range(from_block, to_block + 1, chunk):
+        end = min(start + chunk - 1, to_block)
+        for log in event.getLogs(fromBlock=start, toBlock=end):
+            found.append(
+                {
+                    "block": log.blockNumber,
+                    "profit": log.args.profit,
+                    "loss": log.args.loss,
+                }
+            )
+    return found
+
+
+class StateCache:
+    # keyed by block hash, so a reorg or a reverted local chain can never serve another block's state
+    def __init__(self, strategy, cache_dir=CACHE_DIR):
+        self.path = Path(cache_dir) / f"{strategy.address}.json"
+        self.states = {}
+        if self.path.exists():
+            self.states = json.loads(self.path.read_text())
+
+    def missing(self, keys):
+        return sorted(set(keys) - set(self.states))
+
+    def update(self, states):
+        self.states.update(states)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.states))
+
+    def __getitem__(self, key):
+        return self.states[key]
+
+
+def fetch(cache, reads, max_workers=MAX_WORKERS):
+    # reads maps a cache key to the call producing it. Whatever isn't cached yet is read concurrently
+    todo = cache.missing(reads)
+    if todo:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            cache.update(dict(zip(todo, executor.map(lambda key: reads[key](), todo))))
+
+
+def read_state(strategy, block):
+    s = web3.eth.contract(strategy.address, abi=strategy.abi).functions
+    vault = web3.eth.contract(s.vault().call(block_identifier=block.number), abi=VAULT_ABI).functions
+    stake = web3.eth.contract(s.stake().call(block_identifier=block.number), abi=STAKE_ABI).functions
+    state = {
+        "timestamp": block.timestamp,
+        "depositId": s.depositId().call(block_identifier=block.number),
+        "vestor": s.vestor().call(block_identifier=block.number),
+        "balanceOfStaked": s.balanceOfStaked().call(block_identifier=block.number),
+        "totalDebt": vault.strategies(strategy.address).call(block_identifier=block.number)[6],
+        "stakePricePerShare": stake.getPricePerFullShare().call(block_identifier=block.number),
+    }
+    # 88mph reverts on deposit/vest id 0, which is what the strategy holds until its first deposit
+    if state["depositId"] == 0:
+        state.update(
+            {
+                "estimatedTotalAssets": s.balanceOfWant().call(block_identifier=block.number),
+                "getDepositInfo": NO_DEPOSIT,
+                "vestId": 0,
+                "getVest": NO_VEST,
+            }
+        )
+    else:
+        state.update(
+            {
+                "estimatedTotalAssets": s.estimatedTotalAssets().call(block_identifier=block.number),
+                "getDepositInfo": list(s.getDepositInfo().call(block_identifier=block.number)),
+                "vestId": s.vestId().call(block_identifier=block.number),
+                "getVest": list(s.getVest().call(block_identifier=block.number)),
+            }
+        )
+    return state
+
+
+def read_vest(vestor, vest_id, block):
+    vestor = web3.eth.contract(vestor, abi=interface.IVesting.abi).functions
+    return list(vestor.getVest(vest_id).call(block_identifier=block.number))
+
+
+# Splits a harvest's profit into fixed-rate interest, mph vesting and mph staking.
+#
+# Interest is what _collect() pulls out: assets over debt right before the harvest, as long as the deposit hasn't
+# matured (a matured deposit's interest is rolled over, not collected). The rest of the profit comes from selling mph
+# and is split by how much mph vesting and staking each produced since the previous harvest. The first harvest in the
+# range has no previous harvest to measure from, so all of its mph profit is put down to vesting.
+def attribute(harvest, before, after, prev_after, replaced_vest=None):
+    profit = harvest["profit"]
+    # hasMatured() as evaluated inside the harvest; no deposit reads as matured too, and _collect skips both
+    matured = before["getDepositInfo"][DEPOSIT_MATURATION] < after["timestamp"]
+    interest = 0 if matured else min(profit, max(0, before["estimatedTotalAssets"] - before["totalDebt"]))
+    mph_profit = profit - interest
+
+    vested = staked = 0
+    if prev_after is not None:
+        vested = after["getVest"][VEST_WITHDRAWN]
+        if after["vestId"] == prev_after["vestId"]:
+            vested -= prev_after["getVest"][VEST_WITHDRAWN]
+        elif replaced_vest is not None:
+            # the harvest claimed from the old vest before rolling over into the new one
+            vested += replaced_vest[VEST_WITHDRAWN] - prev_after["getVest"][VEST_WITHDRAWN]
+        # only shares held since the previous harvest earned the whole price gain. Shares staked by tends in between
+        # earned part of it and are left out, so staking is slightly understated rather than overstated
+        pps_gain = max(0, before["stakePricePerShare"] - prev_after["stakePricePerShare"])
+        held = min(prev_after["balanceOfStaked"], before["balanceOfStaked"])
+        staked = held * pps_gain // 10 ** 18
+
+    # without anything to weigh by, sold mph can only have been vested mph
+    staking = mph_profit * staked // (vested + staked) if vested + staked > 0 else 0
+    return {
+        "block": harvest["block"],
+        "profit": profit,
+        "loss": harvest["loss"],
+        "interest": interest,
+        "vesting": mph_profit - staking,
+        "staking": staking,
+    }
+
+
+def replay(strategy, from_block, to_block, cache_dir=CACHE_DIR, max_workers=MAX_WORKERS):
+    found = harvests(strategy, from_block, to_block)
+    numbers = sorted({h["block"] for h in found} | {h["block"] - 1 for h in found})
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        blocks = dict(zip(numbers, executor.map(web3.eth.get_block, numbers)))
+
+    cache = StateCache(strategy, cache_dir)
+    fetch(cache, {blocks[n].hash.hex(): partial(read_state, strategy, blocks[n]) for n in numbers}, max_workers)
+
+    def state(number):
+        return cache[blocks[number].hash.hex()]
+
+    # vests replaced by a rollover, read at the harvest that claimed them one last time
+    replaced = {}
+    for prev, harvest in zip(found, found[1:]):
+        old, new = state(prev["block"]), state(harvest["block"])
+        if old["vestId"] not in (0, new["vestId"]):
+            key = f"{blocks[harvest['block']].hash.hex()}:{old['vestId']}"
+            replaced[harvest["block"]] = key, partial(read_vest, old["vestor"], old["vestId"], blocks[harvest["block"]])
+    fetch(cache, dict(replaced.values()), max_workers)
+
+    report = []
+    prev_after = None
+    for harvest in found:
+        after = state(harvest["block"])
+        replaced_vest = cache[replaced[harvest["block"]][0]] if harvest["block"] in replaced else None
+        report.append(attribute(harvest, state(harvest["block"] - 1), after, prev_after, replaced_vest))
+        prev_after = after
+    return report
+
+
+def main(strategy, from_block, to_block=None):
+    strategy = Strategy.at(strategy)
+    to_block = web3.eth.block_number if to_block is None else int(to_block)
+    report = replay(strategy, int(from_block), to_block)
+
+    columns = ["block", "profit", "loss", "interest", "vesting", "staking"]
+    print("".join(f"{c:>28}" for c in columns))
+    for row in report:
+        print("".join(f"{row[c]:>28}" for c in columns))
+    totals = {c: sum(row[c] for row in report) for c in columns[1:]}
+    print(f"{'total':>28}" + "".join(f"{totals[c]:>28}" for c in columns[1:]))
@@ -2,6 +2,9 @@ import pytest
 from brownie import config
 from brownie import Contract
 
+from scripts.calibrate import lookup
+from scripts.constants import BANCOR_REGISTRY, STAKE_TOKEN, amounts, pools, token_address, whale_address
+
 
 # Function scoped isolation fixture to enable xdist.
 # Snapshots the chain before each test and reverts after test completion.
@@ -45,17 +48,6 @@ def keeper(accounts):
     yield accounts[5]
 
 
-token_address = {
-    "GUSD": "0x056Fd409E1d7A124BD7017459dFEa2F387b6d5Cd",
-    "USDT": "0xdac17f958d2ee523a2206206994597c13d831ec7",
-    "WETH": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
-    "WBTC": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
-    "DAI": "0x6b175474e89094c44da98b954eedeac495271d0f",
-    "USDC": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
-    "LINK": "0x514910771AF9Ca656af840dff83E8264EcF986CA",
-}
-
-
 @pytest.fixture(params=[
     # "GUSD", # Bancor has no GUSD liquidity rip...
     "USDT",
@@ -71,50 +63,16 @@ def token(request):
     yield Contract(token_address[request.param])
 
 
-whale_address = {
-    "GUSD": "0x5f65f7b609678448494De4C87521CdF6cEf1e932",
-    "USDT": "0xa929022c9107643515f5c777ce9a910f0d1e490c",
-    "WETH": "0x030ba81f1c18d280636f32af80b9aad02cf0854e",
-    "WBTC": "0xccf4429db6322d5c611ee964527d42e5d685dd6a",
-    "DAI": "0x5d3a536E4D6DbD6114cc1Ead35777bAB948E3643",
-    "USDC": "0x0A59649758aa4d66E25f08Dd01271e891fe52199",
-    "LINK": "0x98C63b7B319dFBDF3d811530F2ab9DfE4983Af9D",
-}
-
-
 @pytest.fixture(scope="session", autouse=True)
 def token_whale(accounts, token):
     yield accounts.at(whale_address[token.symbol()], force=True)
 
 
-pools = {
-    "GUSD": "0xbFDB51ec0ADc6D5bF2ebBA54248D40f81796E12B",  # GUSD via Aave
-    "USDT": "0xb1b225402b5ec977af8c721f42f21db5518785dc",  # USDT via Aave
-    "WETH": "0xaE5ddE7EA5c44b38c0bCcfb985c40006ED744EA6",  # WETH via Aave
-    "WBTC": "0xA0E78812E9cD3E754a83bbd74A3F1579b50436E8",  # WBTC via Compound
-    # "DAI": "0x4B4626c1265d22B71ded11920795A3c6127A0559",  # DAI via BProtocol
-    "DAI": "0x6D97eA6e14D35e10b50df9475e9EFaAd1982065E",  # DAI via Aave
-    "USDC": "0xF61681b8Cbf87615F30f96F491FA28a2Ff39947a",  # USDC via Cream
-    "LINK": "0x572be575d1aa1ca84d8ac4274067f7bcb578a368",  # LINK via Compound
-}
-
-
 @pytest.fixture(scope="session", autouse=True)
 def pool(token):
     yield pools[token.symbol()]
 
 
-amounts = {
-    "GUSD": 10_000_000,  # GUSD via Aave
-    "USDT": 10_000_000,  # USDT via Aave
-    "WETH": 10_000,  # WETH via Aave
-    "WBTC": 1_000,  # WBTC via Compound
-    "DAI": 10_000_000,  # DAI via BProtocol/Aave
-    "USDC": 10_000_000,  # USDC via Cream
-    "LINK": 500_000,  # LINK via Compound
-}
-
-
 @pytest.fixture(scope="function", autouse=True)
 def amount(accounts, token, user, token_whale):
     amount = amounts[token.symbol()] * 10 ** token.decimals()
@@ -180,14 +138,20 @@ mins = {
 }
 
 
+# values found by `brownie run calibrate` take precedence over the hand-set ones above
+def calibrated_min(symbol):
+    calibrated = lookup(pools[symbol])
+    return mins[symbol] if calibrated is None else [calibrated[1], calibrated[0]]
+
+
 @pytest.fixture(scope="session", autouse=True)
 def min(token):
-    yield mins[token.symbol()]
+    yield calibrated_min(token.symbol())
 
 
 @pytest.fixture(scope="session", autouse=True)
 def min2(token2):
-    yield mins[token2.symbol()]
+    yield calibrated_min(token2.symbol())
 
 
 @pytest.fixture
@@ -205,12 +169,12 @@ def weth_amout(user, weth):
 
 @pytest.fixture
 def stakeToken():
-    yield Contract("0x1702F18c1173b791900F81EbaE59B908Da8F689b")
+    yield Contract(STAKE_TOKEN)
 
 
 @pytest.fixture
 def bancorRegistry():
-    yield Contract("0x52Ae12ABe5D8BD778BD5397F99cA900624CfADD4")
+    yield Contract(BANCOR_REGISTRY)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -258,3 +222,15 @@ def strategy(strategist, keeper, vault, Strategy, gov, pool, stakeToken, bancorR
 @pytest.fixture(scope="session")
 def RELATIVE_APPROX():
     yield 1e-5
+
+
+# per-clone gas recorded by test_clone_gas, keyed by the cloned strategy's token
+clone_gas = {}
+
+
+def pytest_terminal_summary(terminalreporter):
+    if clone_gas:
+        terminalreporter.section("Clone gas")
+        terminalreporter.write_line(f"{'token':<8}{'clone()':>12}{'lookups':>12}{'from source':>14}")
+        for symbol, (plain, lookup, resolved) in sorted(clone_gas.items()):
+            terminalreporter.write_line(f"{symbol:<8}{plain:>12}{lookup:>12}{resolved:>14}")
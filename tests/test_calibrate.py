@@ -0,0 +1,38 @@
+import pytest
+
+from scripts.calibrate import _smallest, calibrate
+
+
+def test_smallest():
+    assert _smallest(0, 100, lambda x: x >= 37) == 37
+    assert _smallest(0, 100, lambda x: True) == 0
+    assert _smallest(1, 1, lambda x: True) == 1
+    # nothing passes
+    assert _smallest(0, 100, lambda x: False) == 101
+
+
+# calibrate() takes its own chain snapshot, replacing the one taken for the test. It is kept in this module so the
+# module reset at the end undoes it
+def test_calibrate(chain, token, vault, strategy, user, amount, gov, percentageFeeModel, percentageFeeModelOwner):
+    if token.symbol() != "LINK":
+        pytest.skip("probing is slow, one pool with non zero minimums is enough")
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    user.transfer(strategy, "1 ether")
+
+    dust, min_withdraw = calibrate(strategy)
+    strategy.setDust(dust, {"from": gov})
+    strategy.setMinWithdraw(min_withdraw, {"from": gov})
+
+    # the strategy's own withdrawals go through with the values found
+    percentageFeeModel.overrideEarlyWithdrawFeeForDeposit(strategy.pool(), strategy.depositId(), 0,
+                                                          {'from': percentageFeeModelOwner})
+    vault.withdraw(vault.balanceOf(user) // 2, user, 10_000, {"from": user})
+    assert token.balanceOf(user) > 0
+
+    strategy.setEmergencyExit({"from": gov})
+    strategy.harvest({"from": gov})
+    assert strategy.getDepositInfo()[0] <= dust
@@ -218,3 +218,24 @@ def test_triggers(
 
     strategy.harvestTrigger(0)
     strategy.tendTrigger(0)
+
+
+def test_loose_want_reported_without_touching_deposit(
+        chain, accounts, token, vault, strategy, user, strategist, amount, RELATIVE_APPROX, gov
+):
+    deposited = amount // 3
+    token.approve(vault.address, deposited, {"from": user})
+    vault.deposit(deposited, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    supply = strategy.getDepositInfo()[0]
+
+    # want sent straight to the strategy is surplus over debt, but it is already loose. _collect must not try to pull
+    # it out of the deposit, which would exit the whole deposit early
+    donated = amount - deposited
+    token.transfer(strategy, donated, {"from": user})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    assert strategy.getDepositInfo()[0] >= supply
+    assert pytest.approx(tx.events["Harvested"]["profit"], rel=RELATIVE_APPROX) == donated
@@ -0,0 +1,58 @@
+from scripts.replay import replay, StateCache
+
+
+def test_replay(chain, accounts, token, vault, strategy, user, strategist, amount, gov, web3, tmp_path):
+    start = chain.height
+
+    # scripted run: fund, then two harvests with vesting in between
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.sleep(3600 * 24 * 50)
+    strategy.tend({"from": gov})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    chain.mine(1)
+
+    # the first harvest happens before there is any deposit to read
+    report = replay(strategy, start, chain.height, cache_dir=tmp_path)
+
+    assert len(report) == 2
+    assert report[0]["interest"] == 0
+    assert report[-1]["block"] == tx.block_number
+    assert report[-1]["profit"] == tx.events["Harvested"]["profit"]
+    # 50 days into a 180 day deposit nothing is collected yet, all of the profit is sold mph
+    assert report[-1]["interest"] == 0
+    assert report[-1]["vesting"] > 0
+
+    # states are cached by block hash, and a rerun is served from the cache
+    block_hash = web3.eth.get_block(tx.block_number).hash.hex()
+    assert StateCache(strategy, tmp_path).missing([block_hash]) == []
+    assert replay(strategy, start, chain.height, cache_dir=tmp_path, max_workers=1) == report
+
+
+def test_replay_maturity(chain, accounts, token, vault, strategy, user, strategist, amount, gov, tmp_path):
+    start = chain.height
+
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    # claim and stake some mph, so staking has a share to compete with
+    chain.sleep(3600 * 24 * 50)
+    strategy.tend({"from": gov})
+    # past maturation the harvest claims the rest of the old vest and rolls over into a new deposit
+    chain.sleep(3600 * 24 * 131)
+    old_deposit = strategy.depositId()
+    tx = strategy.harvest({"from": gov})
+    chain.mine(1)
+    assert strategy.depositId() != old_deposit
+
+    report = replay(strategy, start, chain.height, cache_dir=tmp_path)
+
+    assert report[-1]["block"] == tx.block_number
+    # matured interest is rolled over rather than collected
+    assert report[-1]["interest"] == 0
+    # the claims on the replaced vest still count as vesting
+    assert report[-1]["vesting"] > report[-1]["staking"]
@@ -68,3 +68,17 @@ def test_basic_shutdown(
     assert token.balanceOf(strategy) == 0
     assert token.balanceOf(vault) >= amount  ## The vault has all funds
     ## NOTE: May want to tweak this based on potential loss during migration
+
+
+def test_emergency_exit_before_deposit(token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+
+    # no deposit exists yet, so there is nothing to read or withdraw from the pool
+    assert strategy.depositId() == 0
+    assert strategy.estimatedTotalAssets() == 0
+    strategy.setEmergencyExit({"from": gov})
+    strategy.harvest({"from": gov})
+
+    assert strategy.estimatedTotalAssets() == 0
+    assert token.balanceOf(vault) == amount